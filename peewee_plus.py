@@ -8,29 +8,55 @@ Various extensions, helpers, and utilities for `Peewee`_
                                          discoverable from within Python. This default value will
                                          be correct for the vast majority of applications.
 
+:constant SQLITE_MAX_VARIABLE_NUMBER: The default number of variables that a single SQL query can
+                                      contain for SQLite 3.32 and later. Older versions of SQLite
+                                      default to 999.
+
 :constant SQLITE_DEFAULT_PRAGMAS: The default pragmas that should be used when instantiating an
                                   SQLite database connection. The value for this constant is taken
                                   directly from the `Peewee documentation`_
 
+:constant SQLITE_BULK_LOAD_PRAGMAS: Pragmas for SQLite database connections used to load large
+                                    amounts of data, such as scripts using :func:`bulk_insert`.
+                                    These extend ``SQLITE_DEFAULT_PRAGMAS`` to keep temporary
+                                    storage in memory, memory-map the database file, and use a
+                                    larger page size for new databases.
+
 .. _`Peewee`: https://docs.peewee-orm.com/en/latest/
 
 .. _`Peewee documentation`: https://docs.peewee-orm.com/en/latest/peewee/database.html#recommended-settings
 """
-import contextlib
 import datetime
 import enum
 import functools
 import json
+import os
+import weakref
 from pathlib import Path
 from typing import Any
+from typing import Callable
+from typing import cast
 from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
+from typing import Union
 
 import peewee
 
+# orjson is an optional dependency, installed with the ``orjson`` extra, which the JSONField can
+# use to encode and decode values when ``fast`` is enabled
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 __title__ = "peewee-plus"
 __version__ = "1.3.0"
@@ -47,14 +73,18 @@ __all__ = [
     "__summary__",
     "__url__",
     "__authors__",
+    "bulk_insert",
     "calc_batch_size",
     "EnumField",
     "flat_transaction",
     "JSONField",
     "PathField",
     "PrecisionFloatField",
+    "probe_sqlite_variable_limit",
+    "SQLITE_BULK_LOAD_PRAGMAS",
     "SQLITE_DEFAULT_PRAGMAS",
     "SQLITE_DEFAULT_VARIABLE_LIMIT",
+    "SQLITE_MAX_VARIABLE_NUMBER",
     "TimedeltaField",
 ]
 
@@ -68,6 +98,20 @@ SQLITE_DEFAULT_PRAGMAS: Dict[str, Any] = {
 }
 
 
+# The page size of a database can only be changed before it is switched to WAL mode, so it needs to
+# come before the journal mode
+SQLITE_BULK_LOAD_PRAGMAS: Dict[str, Any] = {
+    "page_size": 32768,
+    **SQLITE_DEFAULT_PRAGMAS,
+    "temp_store": 2,
+    "mmap_size": 268435456,
+}
+
+
+SQLITE_MAX_VARIABLE_NUMBER: int = 32766
+
+_SQLITE_LEGACY_VARIABLE_LIMIT: int = 999
+
 SQLITE_DEFAULT_VARIABLE_LIMIT: int
 
 # With SQLite 3.32 (2020-05-22) the devs bumped the default variable limit to
@@ -79,21 +123,90 @@ SQLITE_DEFAULT_VARIABLE_LIMIT: int
 try:
     import sqlite3
 except ImportError:
-    SQLITE_DEFAULT_VARIABLE_LIMIT = 999
+    SQLITE_DEFAULT_VARIABLE_LIMIT = _SQLITE_LEGACY_VARIABLE_LIMIT
 else:
-    if sqlite3.sqlite_version_info[0] >= 3 or (
+    if sqlite3.sqlite_version_info[0] > 3 or (
         sqlite3.sqlite_version_info[0] == 3 and sqlite3.sqlite_version_info[1] >= 32
     ):
-        SQLITE_DEFAULT_VARIABLE_LIMIT = 32766
+        SQLITE_DEFAULT_VARIABLE_LIMIT = SQLITE_MAX_VARIABLE_NUMBER
     else:
-        SQLITE_DEFAULT_VARIABLE_LIMIT = 999
+        SQLITE_DEFAULT_VARIABLE_LIMIT = _SQLITE_LEGACY_VARIABLE_LIMIT
+
+
+# Number of variables that can be present in a single query for database backends other than
+# SQLite, whose limit is probed from the database instead. The database class is looked up along
+# its MRO so that subclasses (such as ``playhouse.cockroachdb.CockroachDatabase``) are covered
+_DIALECT_VARIABLE_LIMITS: Dict[Type[peewee.Database], int] = {
+    peewee.PostgresqlDatabase: 65535,
+    peewee.MySQLDatabase: 65535,
+}
 
 
 T = TypeVar("T", bound=peewee.Model)
 
 
+# Number of batch sizes, one per combination of model class, database, and variable limit, that
+# are cached at once
+_BATCH_SIZE_CACHE_SIZE: int = 128
+
+
+# Batch sizes calculated by :func:`calc_batch_size`, keyed by model class, database, and variable
+# limit. Once the cache is full the oldest entry is evicted
+_BATCH_SIZES: Dict[
+    Tuple[Type[peewee.Model], peewee.Database, Optional[int]], Optional[int]
+] = {}
+
+
+# Variable limits probed by :func:`probe_sqlite_variable_limit`, keyed by database instance. The
+# keys are weak references so that the cache does not keep closed databases alive
+_PROBED_VARIABLE_LIMITS: "weakref.WeakKeyDictionary[peewee.SqliteDatabase, int]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def probe_sqlite_variable_limit(database: peewee.SqliteDatabase) -> int:
+    """Determine the maximum number of variables an SQLite database accepts in a single query
+
+    The limit is set when SQLite is compiled and can be lowered at runtime, so the only reliable
+    way to determine it is to ask the database connection. Where the Python bindings support it
+    (Python 3.11 and later) the runtime limit of the connection is used; otherwise the compile
+    time options reported by ``PRAGMA compile_options`` are checked, and if no custom limit was
+    compiled in then the default for the installed SQLite version is used.
+
+    The result is cached for each database instance so that the database only needs to be
+    probed once.
+
+    .. note:: Probing requires a connection to the database and will open one if it is not
+              already open. If a connection cannot be opened (for example, because the database
+              has not been initialized yet) then the conservative limit of 999 is returned and
+              nothing is cached.
+
+    :param database: SQLite database to determine the variable limit of
+    :returns: Maximum number of variables that can be present in a single SQL query
+    """
+    if database in _PROBED_VARIABLE_LIMITS:
+        return _PROBED_VARIABLE_LIMITS[database]
+
+    try:
+        connection = database.connection()
+    except peewee.PeeweeException:
+        return _SQLITE_LEGACY_VARIABLE_LIMIT
+
+    if hasattr(connection, "getlimit"):
+        limit = connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    else:
+        limit = SQLITE_DEFAULT_VARIABLE_LIMIT
+        for (option,) in database.execute_sql("PRAGMA compile_options").fetchall():
+            if option.startswith("MAX_VARIABLE_NUMBER="):
+                limit = int(option.partition("=")[2])
+                break
+
+    _PROBED_VARIABLE_LIMITS[database] = limit
+    return limit
+
+
 def calc_batch_size(
-    models: Sequence[T], sqlite_variable_limit: int = SQLITE_DEFAULT_VARIABLE_LIMIT
+    models: Union[Sequence[T], Type[T]], sqlite_variable_limit: Optional[int] = None
 ) -> int:
     """Determine the batch size that should be used when performing queries
 
@@ -101,20 +214,21 @@ def calc_batch_size(
     limit to the number of _variables_, not _records_ that can be referenced in a single query.
 
     The "correct" way to calculate this is to iterate over the model list and tally the number of
-    changed fields, then add one for the table name, and each time you reach the
-    ``SQLITE_VARIABLE_LIMIT`` (which is a known constant) cut a new batch until all the models are
-    processed. This is very complicated because peewee doesn't provide a simple way to reliably
-    identify changed fields.
+    changed fields, and each time you reach the variable limit cut a new batch until all the
+    models are processed. This is very complicated because peewee doesn't provide a simple way to
+    reliably identify changed fields.
 
     The naive way to calculate this (i.e. the way this function does it) is to determine the
     maximum number of variables that _could be_ used to modify a record and use that as the
     constant batch limiter. The theoretical maximum number of variables associated with a single
-    record is equal to the number of fields on that record, plus 1 (for the table name). This
-    gives the batch size (i.e. number of records that can be modified in a single query) as:
+    record is equal to the number of columns of the model. This includes auto-incrementing
+    primary keys: they are usually populated by the database, but nothing prevents a record from
+    specifying them explicitly. This gives the batch size (i.e. number of records that can be
+    modified in a single query) as:
 
     ::
 
-      999 / (len(fields) + 1)
+      sqlite_variable_limit // len(fields)
 
     Where ``fields`` is an array of the fields that could be written on the record.
 
@@ -127,35 +241,333 @@ def calc_batch_size(
         with database.atomic():
             MyModel.bulk_create(models, batch_size=calc_batch_size(models))
 
+    The model class can be passed instead of a sequence of records, which avoids needing to
+    collect the records into a list when they are being generated lazily:
+
+    .. code-block:: python
+
+        rows = ({"name": f"item-{index}"} for index in range(100000))
+
+        with database.atomic():
+            for batch in peewee.chunked(rows, calc_batch_size(MyModel)):
+                MyModel.insert_many(batch).execute()
+
     .. note:: This function (pretty safely) requires that all the records in ``models`` are all
               instances of the same model.
 
-    .. note:: This function just returns ``len(models)`` if the backend is anything other than
-              :class:`peewee.SqliteDatabase`. This is because the limitation this function works
-              around is only applicable to SQLite, so on other platforms the batch size can just
-              be as large as possible. This also helps to support writing code that transparently
-              supports multiple backends.
-
-    :param models: Sequence of models to be created or updated that need to be batched
+    .. note:: PostgreSQL and MySQL also limit the number of variables in a single query, to
+              65535, so the batch size is calculated the same way for those backends. This
+              function just returns ``len(models)`` if the backend is anything else, since the
+              batch size can then just be as large as possible. This also helps to support writing
+              code that transparently supports multiple backends. When a model class is passed
+              for such a backend the number of records is not known, so the batch size is
+              calculated using the conservative ``SQLITE_DEFAULT_VARIABLE_LIMIT`` instead. Models
+              bound to a :class:`peewee.DatabaseProxy` use the database the proxy was initialized
+              with.
+
+    .. note:: The batch size is cached per model class and database, so it is only calculated
+              once for each database a model is used with. Nothing is cached while the database
+              of a model is not known yet, such as when a :class:`peewee.DatabaseProxy` has not
+              been initialized or an SQLite database cannot be probed for its variable limit.
+
+    :param models: Sequence of models to be created or updated that need to be batched, or the
+                   model class of the records that need to be batched
     :param sqlite_variable_limit: Number of variables that can be present in a single SQL query;
-                                  this is defined at compile time in the SQLite bindings for the
-                                  current platform and should not need to be changed unless using
-                                  SQLite bindings that were compiled with custom parameters.
+                                  by default this is determined from the database using
+                                  :func:`probe_sqlite_variable_limit` and should not need to be
+                                  specified unless the limit of the database should be overridden.
     :returns: Number of models that can be processed in a single batch
     """
+    # Model classes need to be checked for first: the peewee model metaclass implements
+    # ``__len__`` and ``__getitem__`` as queries against the database
+    if isinstance(models, type) and issubclass(models, peewee.Model):
+        model_class: Type[peewee.Model] = models
     # We need to inspect the models in the logic below, so if there are no models then just
     # return zero since the batch size doesn't matter anyway
-    if not models:
+    elif not models:
         return 0
-    if isinstance(
-        models[0]._meta.database,  # pylint: disable=protected-access
-        peewee.SqliteDatabase,
+    else:
+        model_class = type(models[0])
+
+    batch_size = _batch_size(model_class, sqlite_variable_limit)
+    if batch_size is not None:
+        return batch_size
+    if model_class is models:
+        return SQLITE_DEFAULT_VARIABLE_LIMIT // _column_count(model_class)
+    return len(models)
+
+
+def _batch_size(
+    model_class: Type[peewee.Model], sqlite_variable_limit: Optional[int]
+) -> Optional[int]:
+    """Determine the batch size for a model class, caching it once the database is known
+
+    The result only depends on the model class, the database, and the variable limit, so it is
+    cached to keep repeated calls to :func:`calc_batch_size` (for example, once per chunk in a
+    loop) down to a single dictionary lookup. The cache holds references to the model classes
+    and databases it was called with, so it is bounded to avoid keeping every database and
+    dynamically created model alive for the lifetime of the process.
+
+    :param model_class: Model class to determine the batch size for
+    :param sqlite_variable_limit: Number of variables that can be present in a single SQL query
+                                  when using SQLite, or ``None`` to probe the database for it
+    :returns: Number of models that can be processed in a single batch, or ``None`` if the
+              database backend of the model does not limit the number of variables in a query
+    """
+    database = model_class._meta.database  # pylint: disable=protected-access
+    if isinstance(database, peewee.DatabaseProxy):
+        database = database.obj
+
+    key = (model_class, database, sqlite_variable_limit)
+    try:
+        return _BATCH_SIZES[key]
+    except KeyError:
+        pass
+
+    # The backend of an uninitialized proxy is not known yet, so there is no limit to apply
+    # and nothing that can be cached until it is initialized
+    if database is None:
+        return None
+
+    variable_limit = _variable_limit(database, sqlite_variable_limit)
+    batch_size = (
+        variable_limit // _column_count(model_class)
+        if variable_limit is not None
+        else None
+    )
+
+    # An SQLite database that cannot be probed yet (for example, because it is deferred) gets
+    # the conservative limit, which is not cached so that the probe is retried on the next call
+    if (
+        isinstance(database, peewee.SqliteDatabase)
+        and sqlite_variable_limit is None
+        and database not in _PROBED_VARIABLE_LIMITS
     ):
-        return int(
+        return batch_size
+
+    # Evict the oldest entry once the cache is full; dictionaries preserve insertion order
+    if len(_BATCH_SIZES) >= _BATCH_SIZE_CACHE_SIZE:
+        del _BATCH_SIZES[next(iter(_BATCH_SIZES))]
+    _BATCH_SIZES[key] = batch_size
+    return batch_size
+
+
+def _bound_fields(model_class: Type[peewee.Model]) -> List[peewee.Field]:
+    """Determine the fields of a model that are bound as query variables when writing a record
+
+    :param model_class: Model class to determine the bound fields of
+    :returns: Every field of the model except for auto-incrementing primary keys, which are
+              populated by the database
+    """
+    return [
+        field
+        for field in model_class._meta.sorted_fields  # pylint: disable=protected-access
+        if not isinstance(field, peewee.AutoField)
+    ]
+
+
+def _column_count(model_class: Type[peewee.Model]) -> int:
+    """Determine the number of columns that can be bound as query variables when writing a record
+
+    :param model_class: Model class to determine the column count of
+    :returns: Number of fields of the model, including any auto-incrementing primary key since
+              records can still specify it explicitly
+    """
+    fields = model_class._meta.sorted_fields  # pylint: disable=protected-access
+    return max(len(fields), 1)
+
+
+def _variable_limit(
+    database: peewee.Database, sqlite_variable_limit: Optional[int] = None
+) -> Optional[int]:
+    """Determine the number of variables that can be present in a single query
+
+    :param database: Database the query will be executed against, after resolving any proxy
+    :param sqlite_variable_limit: Number of variables that can be present in a single SQL query
+                                  when using SQLite, or ``None`` to probe the database for it
+    :returns: Number of variables that can be present in a single SQL query, or ``None`` if the
+              database backend does not limit the number of variables in a query
+    """
+    if isinstance(database, peewee.SqliteDatabase):
+        return (
             sqlite_variable_limit
-            / (len(models[0]._meta.fields) + 1)  # pylint: disable=protected-access
+            if sqlite_variable_limit is not None
+            else probe_sqlite_variable_limit(database)
         )
-    return len(models)
+    # The cached lookup only accepts hashable arguments, which the peewee type stubs do not
+    # declare database classes to be
+    return _dialect_variable_limit(cast(Hashable, type(database)))
+
+
+@functools.lru_cache(maxsize=None)
+def _dialect_variable_limit(database_class: Type[peewee.Database]) -> Optional[int]:
+    """Determine the variable limit for a database backend other than SQLite
+
+    The lookup walks the MRO of the database class so that subclasses of the supported backends
+    are matched, and is cached so that the walk only happens once per database class.
+
+    :param database_class: Class of the database to determine the variable limit for
+    :returns: Number of variables that can be present in a single SQL query, or ``None`` if the
+              backend does not limit the number of variables in a query
+    """
+    for parent in database_class.__mro__:
+        if parent in _DIALECT_VARIABLE_LIMITS:
+            return _DIALECT_VARIABLE_LIMITS[parent]
+    return None
+
+
+def bulk_insert(
+    model: Type[T],
+    rows: Iterable[Any],
+    *,
+    fields: Optional[Sequence[peewee.Field]] = None,
+    on_conflict: Optional[str] = None,
+    database: Optional[peewee.Database] = None,
+    sqlite_variable_limit: Optional[int] = None,
+    compiled: bool = False,
+) -> None:
+    """Insert rows in as few queries as the database backend allows
+
+    This combines :func:`calc_batch_size`, :func:`peewee.chunked`, and
+    :meth:`peewee.Model.insert_many` into a single helper: the batch size is calculated once,
+    a single transaction is opened, and one multi-row ``INSERT`` query is executed for each
+    batch of rows.
+
+    Example usage:
+
+    .. code-block:: python
+
+        rows = ({"name": f"item-{index}"} for index in range(100000))
+
+        bulk_insert(MyModel, rows)
+
+    .. note:: The rows are consumed lazily, so ``rows`` can be a generator. The exception to
+              this is when the backend does not limit the number of variables in a query (see
+              :func:`calc_batch_size`), in which case all the rows are inserted in a single query.
+
+    .. note:: When ``compiled`` is enabled the ``INSERT`` query is built directly, once for each
+              batch size, rather than being compiled by peewee for every batch. In this mode
+              every row must be a tuple or list of values for ``fields`` (or, if ``fields`` is
+              not specified, for every field of the model except for auto-incrementing primary
+              keys, in definition order). Values are still converted using the field, but
+              defaults are not applied for fields that are omitted and ``on_conflict`` is not
+              supported.
+
+    :param model: Model class to insert the rows into
+    :param rows: Iterable of rows to insert; see :meth:`peewee.Model.insert_many` for the
+                 accepted formats
+    :param fields: Fields that the values in ``rows`` correspond to, if the rows are tuples or
+                   lists. If specified then the batch size is calculated using only these fields.
+    :param on_conflict: Optional conflict resolution action for the insert queries, such as
+                        ``"IGNORE"`` or ``"REPLACE"``
+    :param database: Database to insert the rows into; defaults to the database of ``model``
+    :param sqlite_variable_limit: Number of variables that can be present in a single SQL query
+                                  when using SQLite; see :func:`calc_batch_size`
+    :param compiled: Whether to build the ``INSERT`` queries directly rather than through peewee
+    :raises ValueError: If ``compiled`` and ``on_conflict`` are both specified, or if ``compiled``
+                        is enabled and a row is a mapping or does not have exactly one value
+                        for every field
+    """
+    if compiled and on_conflict is not None:
+        raise ValueError("Conflict resolution is not supported for compiled inserts")
+
+    if database is None:
+        database = model._meta.database  # pylint: disable=protected-access
+    if isinstance(database, peewee.DatabaseProxy):
+        database = database.obj
+
+    bound_fields = fields if fields is not None else _bound_fields(model)
+    variable_limit = _variable_limit(database, sqlite_variable_limit)
+    if variable_limit is None:
+        batches: Iterable[List[Any]] = [list(rows)]
+    elif fields is not None:
+        batches = peewee.chunked(rows, variable_limit // max(len(fields), 1))
+    else:
+        batches = peewee.chunked(rows, variable_limit // _column_count(model))
+
+    with database.atomic():
+        for batch in batches:
+            if not batch:
+                continue
+            if compiled:
+                values: List[Any] = []
+                for row in batch:
+                    values.extend(_compiled_row_values(bound_fields, row))
+                database.execute_sql(
+                    _compile_bulk_insert(
+                        model,
+                        tuple(field.column_name for field in bound_fields),
+                        len(batch),
+                        database,
+                    ),
+                    values,
+                )
+                continue
+            query = model.insert_many(batch, fields=fields)
+            if on_conflict is not None:
+                query = query.on_conflict(on_conflict)
+            query.execute(database)
+
+
+def _compiled_row_values(fields: Sequence[peewee.Field], row: Any) -> List[Any]:
+    """Convert a row for a compiled insert into the values to bind to the query
+
+    :param fields: Fields that the values in the row correspond to
+    :param row: Tuple or list of values for the fields
+    :returns: Database values of the row, in the same order as ``fields``
+    :raises ValueError: If the row is a mapping or does not have exactly one value for every field
+    """
+    if isinstance(row, Mapping):
+        raise ValueError(
+            f"Expected a tuple or list of values for each row but got mapping {row!r}"
+        )
+    if len(row) != len(fields):
+        raise ValueError(
+            f"Expected {len(fields)} values for each row but got {len(row)} in row {row!r}"
+        )
+    return [field.db_value(value) for field, value in zip(fields, row)]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_bulk_insert(
+    model: Type[peewee.Model],
+    columns: Tuple[str, ...],
+    batch_size: int,
+    database: peewee.Database,
+) -> str:
+    """Build the SQL for inserting a fixed number of rows in a single query
+
+    The SQL only depends on the arguments, so it is cached: inserting many rows in batches of a
+    constant size only needs to build it once for the full batches and once for the final batch.
+
+    :param model: Model class to insert rows into
+    :param columns: Names of the columns that each row has values for
+    :param batch_size: Number of rows to insert in the query
+    :param database: Database the query will be executed against, used for quoting and for the
+                     parameter placeholder
+    :returns: ``INSERT`` query with a placeholder for every value of every row
+    """
+    table = peewee.Entity(
+        *[
+            part
+            for part in (
+                model._meta.schema,  # pylint: disable=protected-access
+                model._meta.table_name,  # pylint: disable=protected-access
+            )
+            if part
+        ]
+    )
+    prefix, _ = (
+        database.get_sql_context()
+        .literal("INSERT INTO ")
+        .sql(table)
+        .literal(" ")
+        .sql(peewee.EnclosedNodeList([peewee.Entity(column) for column in columns]))
+        .literal(" VALUES ")
+        .query()
+    )
+    row = f"({', '.join([database.param] * len(columns))})"
+    return prefix + ", ".join([row] * batch_size)
 
 
 def flat_transaction(interface: peewee.Database):
@@ -192,7 +604,9 @@ def flat_transaction(interface: peewee.Database):
     def outer(func):
         @functools.wraps(func)
         def inner(*args, **kwargs):
-            with interface.atomic() if not interface.in_transaction() else contextlib.nullcontext():
+            if interface.in_transaction():
+                return func(*args, **kwargs)
+            with interface.atomic():
                 return func(*args, **kwargs)
 
         return inner
@@ -247,17 +661,31 @@ class PathField(peewee.CharField):  # pylint: disable=abstract-method
     def __init__(self, *args, relative_to: Optional[Path] = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.relative_to = relative_to
+        self._relative_to_prefix = (
+            os.path.join(os.fspath(relative_to), "") if relative_to else None
+        )
+        # Resolve the concrete path class for the platform (``PosixPath`` or ``WindowsPath``)
+        # once rather than having ``Path`` dispatch to it for every value read
+        self._path_class = type(Path())
+        self._relative_to_path = self._path_class(relative_to) if relative_to else None
 
     def db_value(self, value: Path) -> str:
-        if value.is_absolute() and self.relative_to:
-            value = value.relative_to(self.relative_to)
-        return super().db_value(value)
+        path = os.fspath(value)
+        if self._relative_to_prefix and os.path.isabs(path):
+            # Paths under the root can be made relative with a string slice; anything else is
+            # left to pathlib, which handles the root itself and raises for unrelated paths
+            if path.startswith(self._relative_to_prefix):
+                path = path[len(self._relative_to_prefix) :]
+            else:
+                path = os.fspath(Path(path).relative_to(self.relative_to))
+        return super().db_value(path)
 
     def python_value(self, value: str) -> Path:
+        path = self._path_class(super().python_value(value))
         return (
-            self.relative_to / Path(super().python_value(value))
-            if self.relative_to
-            else Path(super().python_value(value))
+            self._relative_to_path / path
+            if self._relative_to_path is not None
+            else path
         )
 
 
@@ -287,9 +715,10 @@ class PrecisionFloatField(peewee.FloatField):  # pylint: disable=abstract-method
         super().__init__(*args, **kwargs)
         self.max_digits = max_digits
         self.decimal_places = decimal_places
+        self._modifiers = (max_digits, decimal_places)
 
     def get_modifiers(self):
-        return [self.max_digits, self.decimal_places]
+        return self._modifiers
 
 
 class JSONField(peewee.TextField):  # pylint: disable=abstract-method
@@ -315,10 +744,36 @@ class JSONField(peewee.TextField):  # pylint: disable=abstract-method
     .. warning:: This is a very bad way to store data in a RDBMS and effectively makes the data
                  contained in the field unqueriable.
 
+    .. _`orjson`: https://github.com/ijl/orjson
+
     :param dump_params: Additional keyword arguments to unpack into :func:`json.dump`
     :param load_params: Additional keyword arguments to unpack into :func:`json.load`
+    :param fast: Whether to encode and decode values using `orjson`_, which is significantly
+                 faster than the standard library. This requires the ``orjson`` extra to be
+                 installed. The ``default``, ``indent`` (``2`` only), and ``sort_keys`` parameters
+                 in ``dump_params`` are translated to their orjson equivalents; if any other
+                 parameters are given, or any ``load_params`` are given, then the standard library
+                 is used instead. Values orjson rejects are retried with the standard library.
+                 Note that orjson does not behave identically to the standard library:
+
+                 * ``NaN`` and infinite floats are written as ``null``
+                 * Integers outside of the 64-bit range are written correctly but are read back
+                   as floats, losing precision
+                 * ``datetime``, ``UUID``, ``Enum``, and dataclass values are encoded rather than
+                   raising :err:`ValueError`
+                 * The stored text is compact and does not escape non-ASCII characters, so it
+                   differs from the text the standard library writes for the same value; this
+                   matters when comparing the stored text or relying on a unique index over it
+    :param raw: Whether ``str``, ``bytes``, and ``bytearray`` values set to the field are already
+                encoded JSON. If enabled then these values are written to the database as-is
+                (decoded as UTF-8 if necessary) rather than being encoded again, which avoids
+                re-serializing data that was read and written back without being decoded. Note
+                that these values are not validated, so invalid JSON will only be detected when
+                the value is read back. By default all values are encoded, meaning that a string
+                set to the field is stored as a JSON string.
     :raises ValueError: When attempting to set a non-JSON serializable object to the field
     :raises peewee.IntegrityError: When the underlying database value is not JSON serializable
+    :raises ImportError: If ``fast`` is enabled but orjson is not installed
     """
 
     def __init__(
@@ -326,29 +781,119 @@ class JSONField(peewee.TextField):  # pylint: disable=abstract-method
         *args,
         dump_params: Optional[Dict[str, Any]] = None,
         load_params: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        fast: bool = False,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if fast and orjson is None:
+            raise ImportError(
+                "JSONField(fast=True) requires orjson; install the 'orjson' extra"
+            )
         self.dump_params = dump_params or {}
         self.load_params = load_params or {}
+        self.raw = raw
+        self.fast = fast
+        self._dumps = _make_json_encoder(self.dump_params, fast)
+        self._loads = _make_json_decoder(self.load_params, fast)
 
     def db_value(self, value: Any) -> str:
+        if self.raw and isinstance(value, (str, bytes, bytearray)):
+            return super().db_value(
+                value if isinstance(value, str) else value.decode("utf-8")
+            )
         try:
-            return super().db_value(json.dumps(value, **self.dump_params))
+            return super().db_value(self._dumps(value))
         except TypeError as err:
             raise ValueError(
                 f"Failed to JSON encode object of type '{type(value)}'"
             ) from err
 
-    def python_value(self, value: str) -> Any:
+    def python_value(self, value: Optional[str]) -> Any:
+        # SQL NULL is not JSON; return it directly rather than sending it through the decoder
+        if value is None:
+            return None
         try:
-            return json.loads(super().python_value(value), **self.load_params)
+            return self._loads(super().python_value(value))
         except json.JSONDecodeError as err:
             raise peewee.IntegrityError(
                 f"Failed to decode JSON value from database column '{self.column}'"
             ) from err
 
 
+def _make_json_encoder(
+    dump_params: Dict[str, Any], fast: bool = False
+) -> Callable[[Any], str]:
+    """Build the function used by :class:`JSONField` to encode values
+
+    :param dump_params: Keyword arguments for :func:`json.dumps`
+    :param fast: Whether to encode values using orjson where the parameters allow it
+    :returns: Callable that encodes a value to a JSON string, raising :err:`TypeError` if the
+              value is not JSON serializable
+    """
+    # The type stubs of json.dumps declare the keyword arguments individually, which mypy cannot
+    # match against the unpacked parameters
+    stdlib_dumps = cast(
+        Callable[[Any], str], functools.partial(json.dumps, **dump_params)
+    )
+    if (
+        not fast
+        or orjson is None
+        or not set(dump_params) <= {"default", "indent", "sort_keys"}
+        or dump_params.get("indent") not in (None, 2)
+    ):
+        return stdlib_dumps
+
+    option = orjson.OPT_NON_STR_KEYS
+    if dump_params.get("indent"):
+        option |= orjson.OPT_INDENT_2
+    if dump_params.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    orjson_dumps = functools.partial(
+        orjson.dumps, default=dump_params.get("default"), option=option
+    )
+
+    def dumps(value: Any) -> str:
+        # orjson.JSONEncodeError is a subclass of TypeError; it is stricter than the standard
+        # library in a few places (such as integers larger than 64 bits) so fall back to the
+        # standard library for anything it rejects
+        try:
+            return orjson_dumps(value).decode("utf-8")
+        except TypeError:
+            return stdlib_dumps(value)
+
+    return dumps
+
+
+def _make_json_decoder(
+    load_params: Dict[str, Any], fast: bool = False
+) -> Callable[[str], Any]:
+    """Build the function used by :class:`JSONField` to decode values
+
+    :param load_params: Keyword arguments for :func:`json.loads`
+    :param fast: Whether to decode values using orjson where the parameters allow it
+    :returns: Callable that decodes a JSON string, raising :err:`json.JSONDecodeError` if the
+              string is not valid JSON
+    """
+    stdlib_loads = cast(
+        Callable[[str], Any], functools.partial(json.loads, **load_params)
+    )
+    if not fast or orjson is None or load_params:
+        return stdlib_loads
+    orjson_loads = orjson.loads
+
+    def loads(value: str) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError; it rejects some values
+        # that the standard library accepts (such as ``NaN``) so fall back to the standard
+        # library for anything it rejects
+        try:
+            return orjson_loads(value)
+        except json.JSONDecodeError:
+            return stdlib_loads(value)
+
+    return loads
+
+
 class EnumField(peewee.CharField):  # pylint: disable=abstract-method
     """Field class for storing Enums
 
@@ -386,19 +931,29 @@ class EnumField(peewee.CharField):  # pylint: disable=abstract-method
     def __init__(self, enumeration: Type[enum.Enum], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.enumeration = enumeration
+        self._members = dict(enumeration.__members__)
+        # Built from ``__members__`` rather than by iterating the enum so that aliases, such as
+        # multi-bit members of a flag, are included; the canonical name is listed first
+        self._names: Dict[enum.Enum, str] = {}
+        for name, member in enumeration.__members__.items():
+            self._names.setdefault(member, name)
 
     def db_value(self, value: enum.Enum) -> str:
         if not isinstance(value, self.enumeration):
             raise TypeError(f"Enum {self.enumeration.__name__} has no value '{value}'")
-        return super().db_value(value.name)
+        try:
+            return super().db_value(self._names[value])
+        except KeyError:
+            # Composite flags that are not defined as members of the enum
+            return super().db_value(value.name)
 
     def python_value(self, value: str) -> enum.Enum:
+        # Most backends return strings, which can be looked up directly; anything else (such as
+        # bytes from a binary collation) is converted by the parent field first
+        if not isinstance(value, str):
+            value = super().python_value(value)
         try:
-            return (
-                None
-                if value is None and self.null
-                else self.enumeration[super().python_value(value)]
-            )
+            return None if value is None and self.null else self._members[value]
         except KeyError:
             raise peewee.IntegrityError(
                 f"Enum {self.enumeration.__name__} has no value with name '{value}'"
@@ -1,4 +1,7 @@
-import uuid
+# pylint: disable=redefined-outer-name
+import functools
+from typing import Tuple
+from typing import Type
 
 import peewee
 import pytest
@@ -6,13 +9,87 @@ import pytest
 import peewee_plus
 
 
-@pytest.fixture(scope="function")
-def fakedb(tmp_path):
-    """Create a temporary pho-database (fakedb) for testing fields"""
+# Test models are defined once at module level and bound to this proxy, which the ``fakedb``
+# fixture initializes with the test database
+fakedb_proxy = peewee.DatabaseProxy()
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_sql(model: Type[peewee.Model]) -> Tuple[Tuple[str, tuple], ...]:
+    """Build the queries that create the table and indexes of a test model
+
+    Every test creates its tables from scratch, so the queries are only compiled once per model
+    and reused for the rest of the session.
+    """
+
+    # The schema manager only exposes methods that execute the queries, so the private methods
+    # that build them are used instead; the peewee type stubs do not declare these
+    # pylint: disable=protected-access
+    schema = model._schema  # type: ignore[attr-defined]
+    context = model._meta.database.get_sql_context
+    return tuple(
+        context().sql(query).query()
+        for query in (schema._create_table(), *schema._create_indexes())
+    )
+
+
+def create_tables(database: peewee.Database, *models: Type[peewee.Model]) -> None:
+    """Create the tables for test models using their cached schema queries
+
+    :param database: Database to create the tables in
+    :param models: Models to create tables for, in dependency order
+    """
+
+    for model in models:
+        for query, params in _schema_sql(model):
+            database.execute_sql(query, params)
+
+
+@pytest.fixture(scope="session")
+def fakedb_engine():
+    """Create the in-memory database shared by every test in the session
+
+    The database is only held in memory, so tests never wait on disk writes. Tests that depend
+    on an on-disk database file create their own under ``tmp_path``.
+    """
 
     sqlite = peewee.SqliteDatabase(
-        str(tmp_path / f"{uuid.uuid4()}.db"),
-        pragmas=peewee_plus.SQLITE_DEFAULT_PRAGMAS,
+        "file::memory:?cache=shared",
+        uri=True,
+        pragmas=peewee_plus.SQLITE_BULK_LOAD_PRAGMAS,
+        timeout=5,
     )
 
     yield sqlite
+
+    sqlite.close()
+
+
+@pytest.fixture(scope="function")
+def fakedb(fakedb_engine):
+    """Provide a pho-database (fakedb) for testing fields
+
+    The underlying database is shared across the test session so that it only needs to be
+    opened once, and is used to initialize ``fakedb_proxy``. Every table is dropped after each
+    test: different tests define different models with the same table name, so the tables
+    cannot simply be emptied.
+    """
+
+    fakedb_proxy.initialize(fakedb_engine)
+
+    yield fakedb_engine
+
+    for table in fakedb_engine.get_tables():
+        fakedb_engine.execute_sql(f'DROP TABLE "{table}"')
+
+
+@pytest.fixture(scope="function")
+def atomic_db(fakedb):
+    """Wrap the fakedb in a transaction for the duration of the test
+
+    Tests that save several records individually use this so that the records are written to the
+    database in a single commit rather than one commit per record.
+    """
+
+    with fakedb.atomic():
+        yield fakedb
@@ -0,0 +1,137 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=missing-class-docstring
+# pylint: disable=too-few-public-methods
+# pylint: disable=unused-import
+import sqlite3
+
+import peewee
+import pytest
+
+import peewee_plus
+from .fixtures import create_tables
+from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class InsertModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    name = peewee.CharField(unique=True)
+    data = peewee.IntegerField()
+
+
+class CompiledModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    name = peewee.CharField()
+    data = peewee_plus.JSONField()
+
+
+def test_public_api():
+    """Test that the public API components are exposed via ``__all__``"""
+
+    assert peewee_plus.bulk_insert.__name__ in peewee_plus.__all__
+    assert "SQLITE_BULK_LOAD_PRAGMAS" in peewee_plus.__all__
+
+
+def test_insert(fakedb):
+    """Test inserting more rows than fit in a single query"""
+
+    create_tables(fakedb, InsertModel)
+
+    # Three is just chosen as an arbitrary multiplier to ensure the rows need to be split into
+    # multiple batches
+    count = peewee_plus.calc_batch_size([InsertModel()], sqlite_variable_limit=999) * 3
+    peewee_plus.bulk_insert(
+        InsertModel,
+        ({"name": f"item-{index}", "data": index} for index in range(count)),
+        sqlite_variable_limit=999,
+    )
+    assert InsertModel.select().count() == count
+
+    peewee_plus.bulk_insert(
+        InsertModel,
+        [("item-0", -1), ("extra", -1)],
+        fields=[InsertModel.name, InsertModel.data],
+        on_conflict="IGNORE",
+    )
+    assert InsertModel.select().count() == count + 1
+    assert InsertModel.get(InsertModel.name == "item-0").data == 0
+
+    peewee_plus.bulk_insert(InsertModel, [])
+    assert InsertModel.select().count() == count + 1
+
+
+def test_explicit_primary_key(fakedb):
+    """Test inserting rows that specify the primary key"""
+
+    create_tables(fakedb, InsertModel)
+
+    # Lower the limit of the connection to match the limit passed to the function, so that
+    # batches which do not leave room for the primary key fail to execute
+    connection = fakedb.connection()
+    if not hasattr(connection, "setlimit"):
+        pytest.skip("Connection limits can only be changed on Python 3.11 and later")
+    limit = connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    try:
+        peewee_plus.bulk_insert(
+            InsertModel,
+            (
+                {"id": index + 1, "name": f"item-{index}", "data": index}
+                for index in range(999)
+            ),
+            sqlite_variable_limit=999,
+        )
+    finally:
+        connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit)
+
+    assert InsertModel.select().count() == 999
+
+
+def test_pragmas(tmp_path):
+    """Test that the bulk load pragmas are applied to new databases"""
+
+    bulkdb = peewee.SqliteDatabase(
+        str(tmp_path / "bulk.db"), pragmas=peewee_plus.SQLITE_BULK_LOAD_PRAGMAS
+    )
+
+    # The page size is only applied once the database is first written to
+    bulkdb.execute_sql("CREATE TABLE bulk_table (data INTEGER)")
+
+    for pragma in ("page_size", "journal_mode", "temp_store", "mmap_size"):
+        assert bulkdb.pragma(pragma) == peewee_plus.SQLITE_BULK_LOAD_PRAGMAS[pragma]
+
+
+def test_compiled(fakedb):
+    """Test inserting rows using the compiled query"""
+
+    create_tables(fakedb, CompiledModel)
+
+    batch_size = peewee_plus.calc_batch_size(CompiledModel, sqlite_variable_limit=999)
+    count = batch_size * 3 + 1
+    peewee_plus.bulk_insert(
+        CompiledModel,
+        ((f"item-{index}", {"index": index}) for index in range(count)),
+        sqlite_variable_limit=999,
+        compiled=True,
+    )
+    assert CompiledModel.select().count() == count
+    assert CompiledModel.get(CompiledModel.name == f"item-{count - 1}").data == {
+        "index": count - 1
+    }
+
+    with pytest.raises(ValueError):
+        peewee_plus.bulk_insert(CompiledModel, [], on_conflict="IGNORE", compiled=True)
+
+    # Mappings are rejected rather than having their keys inserted as the values
+    for row in (
+        ("too-long", {"index": -1}, 99),
+        ("too-short",),
+        {"name": "mapping", "data": {"index": -1}},
+    ):
+        with pytest.raises(ValueError):
+            peewee_plus.bulk_insert(CompiledModel, [row], compiled=True)
+    assert CompiledModel.select().count() == count
@@ -2,10 +2,33 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=too-few-public-methods
 # pylint: disable=unused-import
+import gc
+import sqlite3
+import weakref
+
 import peewee
+import pytest
 
 import peewee_plus
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class SqliteModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    data = peewee.IntegerField()
+
+
+class ProxyModel(peewee.Model):
+    class Meta:
+        # This proxy is never initialized, so there is no database backend to limit the batch size
+        database = peewee.DatabaseProxy()
+
+    data = peewee.IntegerField()
 
 
 def test_public_api():
@@ -13,27 +36,22 @@ def test_public_api():
 
     assert peewee_plus.calc_batch_size.__name__ in peewee_plus.__all__
     assert peewee_plus.flat_transaction.__name__ in peewee_plus.__all__
+    assert peewee_plus.probe_sqlite_variable_limit.__name__ in peewee_plus.__all__
     assert "SQLITE_DEFAULT_VARIABLE_LIMIT" in peewee_plus.__all__
+    assert "SQLITE_MAX_VARIABLE_NUMBER" in peewee_plus.__all__
     assert "SQLITE_DEFAULT_PRAGMAS" in peewee_plus.__all__
 
 
 def test_sqlite(fakedb):
     """Test the calculation of batch sizes on SQLite"""
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        data = peewee.IntegerField()
+    limit = peewee_plus.probe_sqlite_variable_limit(fakedb)
 
     # Three is just chosen as an arbitrary multiplier to ensure the value is larger than the
-    # sqlite variable limit
-    models = [
-        TestModel(item) for item in range(peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT * 3)
-    ]
-    assert (
-        peewee_plus.calc_batch_size(models) <= peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT
-    )
+    # sqlite variable limit. Only the first record is inspected, so repeating a single
+    # record avoids constructing a model instance for every item.
+    models = [SqliteModel(1)] * (limit * 3)
+    assert peewee_plus.calc_batch_size(models) <= limit
     assert peewee_plus.calc_batch_size(models) < len(models)
 
     assert peewee_plus.calc_batch_size([]) == 0
@@ -42,17 +60,173 @@ def test_sqlite(fakedb):
 def test_non_sqlite():
     """Test the calculation of batch sizes on non-SQLite"""
 
+    # Three is just chosen as an arbitrary multiplier to ensure the value is larger than the
+    # sqlite variable limit
+    assert peewee_plus.calc_batch_size(
+        [ProxyModel(1)] * (peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT * 3)
+    ) == (peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT * 3)
+
+
+def test_cache(fakedb):
+    """Test that the batch size is not cached before the database is known"""
+
+    # The proxy is initialized below, so the model is defined here rather than at module level
+    # to avoid leaking that change into other tests
+    proxy = peewee.DatabaseProxy()
+
     class TestModel(peewee.Model):
         class Meta:
-            database = peewee.DatabaseProxy()
+            database = proxy
 
         data = peewee.IntegerField()
 
-    # Three is just chosen as an arbitrary multiplier to ensure the value is larger than the
-    # sqlite variable limit
-    assert peewee_plus.calc_batch_size(
-        [
-            TestModel(item)
-            for item in range(peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT * 3)
-        ]
-    ) == (peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT * 3)
+    models = [TestModel(1)] * 100000
+    assert peewee_plus.calc_batch_size(models) == len(models)
+
+    # The model has two columns: the data field and the automatic primary key
+    proxy.initialize(fakedb)
+    assert peewee_plus.calc_batch_size(models) == (
+        peewee_plus.probe_sqlite_variable_limit(fakedb) // 2
+    )
+
+
+def test_deferred(tmp_path):
+    """Test that the batch size is not cached before a deferred database is initialized"""
+
+    deferred = peewee.SqliteDatabase(None)
+
+    class TestModel(peewee.Model):
+        class Meta:
+            database = deferred
+
+        data = peewee.IntegerField()
+
+    models = [TestModel(1)] * 100000
+    assert peewee_plus.calc_batch_size(models) == 999 // 2
+
+    deferred.init(str(tmp_path / "deferred.db"))
+    try:
+        assert peewee_plus.calc_batch_size(models) == (
+            peewee_plus.probe_sqlite_variable_limit(deferred) // 2
+        )
+    finally:
+        deferred.close()
+
+
+def test_release():
+    """Test that the batch size cache does not keep databases alive indefinitely"""
+
+    def calculate(bound):
+        class TestModel(peewee.Model):
+            class Meta:
+                database = bound
+
+            data = peewee.IntegerField()
+
+        return peewee_plus.calc_batch_size([TestModel(1)])
+
+    released = peewee.SqliteDatabase(":memory:")
+    calculate(released)
+    reference = weakref.ref(released)
+    del released
+
+    # Fill the cache with other entries so that the first one is evicted
+    other = peewee.SqliteDatabase(":memory:")
+    cache_size = peewee_plus._BATCH_SIZE_CACHE_SIZE  # pylint: disable=protected-access
+    for _ in range(cache_size):
+        calculate(other)
+    other.close()
+
+    gc.collect()
+    assert reference() is None
+
+
+def test_probe(fakedb):
+    """Test that the probed variable limit is accepted by SQLite"""
+
+    limit = peewee_plus.probe_sqlite_variable_limit(fakedb)
+    assert limit >= 999
+    assert peewee_plus.probe_sqlite_variable_limit(fakedb) == limit
+
+    query = f"SELECT 0 IN ({', '.join('?' for _ in range(limit))})"
+    assert fakedb.execute_sql(query, list(range(limit))).fetchone() == (1,)
+
+    uninitialized = peewee.SqliteDatabase(None)
+    assert peewee_plus.probe_sqlite_variable_limit(uninitialized) == 999
+
+
+def test_dialects():
+    """Test the calculation of batch sizes on backends with a variable limit"""
+
+    # The proxy is initialized with different backends below, so the model is defined here
+    # rather than being bound to the shared test database proxy
+    proxy = peewee.DatabaseProxy()
+
+    class TestModel(peewee.Model):
+        class Meta:
+            database = proxy
+
+        data = peewee.IntegerField()
+        more_data = peewee.IntegerField()
+
+    models = [TestModel(data=1, more_data=2)] * 100000
+
+    proxy.initialize(peewee.PostgresqlDatabase(None))
+    assert peewee_plus.calc_batch_size(models) == 65535 // 3
+
+    proxy.initialize(peewee.MySQLDatabase(None))
+    assert peewee_plus.calc_batch_size(models) == 65535 // 3
+
+
+def test_model_class(fakedb):
+    """Test the calculation of batch sizes from a model class"""
+
+    assert peewee_plus.calc_batch_size(SqliteModel) == peewee_plus.calc_batch_size(
+        [SqliteModel(1)]
+    )
+    assert peewee_plus.calc_batch_size(SqliteModel) == (
+        peewee_plus.probe_sqlite_variable_limit(fakedb) // 2
+    )
+    assert peewee_plus.calc_batch_size(ProxyModel) == (
+        peewee_plus.SQLITE_DEFAULT_VARIABLE_LIMIT // 2
+    )
+
+
+def test_explicit_primary_key(fakedb):
+    """Test that the batch size leaves room for rows that specify the primary key"""
+
+    create_tables(fakedb, SqliteModel)
+
+    # Lower the limit of the connection so that the rows do not fit into a single query
+    connection = fakedb.connection()
+    if not hasattr(connection, "setlimit"):
+        pytest.skip("Connection limits can only be changed on Python 3.11 and later")
+    limit = connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    try:
+        batch_size = peewee_plus.calc_batch_size(SqliteModel, sqlite_variable_limit=999)
+        rows = ({"id": item + 1, "data": item} for item in range(batch_size * 3))
+        with fakedb.atomic():
+            for batch in peewee.chunked(rows, batch_size):
+                SqliteModel.insert_many(batch).execute()
+    finally:
+        connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit)
+
+    assert SqliteModel.select().count() == batch_size * 3
+
+
+def test_insert_batches(fakedb):
+    """Test inserting records in batches of the calculated size"""
+
+    create_tables(fakedb, SqliteModel)
+
+    # The conservative limit keeps the number of rows small while still needing several batches
+    batch_size = peewee_plus.calc_batch_size(SqliteModel, sqlite_variable_limit=999)
+    count = batch_size * 3 + 1
+    rows = ({"data": item} for item in range(count))
+
+    with fakedb.atomic():
+        for batch in peewee.chunked(rows, batch_size):
+            SqliteModel.insert_many(batch).execute()
+
+    assert SqliteModel.select().count() == count
+    assert SqliteModel.get(SqliteModel.data == count - 1)
@@ -8,7 +8,52 @@ import peewee
 import pytest
 
 import peewee_plus
+from .fixtures import atomic_db
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class BasicEnum(enum.Enum):
+    FOO = "fizz"
+    BAR = "buzz"
+
+
+class ModifiedEnum(enum.Enum):
+    BAR = "buzz"
+
+
+class BadEnum(enum.Enum):
+    NOTHING = "nowhere"
+
+
+class FlagEnum(enum.Flag):
+    READ = 1
+    WRITE = 2
+    READ_WRITE = READ | WRITE
+
+
+class BasicModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    data = peewee_plus.EnumField(BasicEnum)
+
+
+class ModifiedModel(peewee.Model):
+    class Meta:
+        table_name = BasicModel._meta.table_name  # pylint: disable=protected-access
+        database = fakedb_proxy
+
+    data = peewee_plus.EnumField(ModifiedEnum)
+
+
+class FlagModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    data = peewee_plus.EnumField(FlagEnum)
 
 
 def test_public_api():
@@ -17,43 +62,48 @@ def test_public_api():
     assert peewee_plus.EnumField.__name__ in peewee_plus.__all__
 
 
-def test_enum(fakedb):
+def test_enum(atomic_db):
     """Test basic functionality of the enum field"""
 
-    class TestEnum(enum.Enum):
-        FOO = "fizz"
-        BAR = "buzz"
+    create_tables(atomic_db, BasicModel)
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
+    model = BasicModel(data=BasicEnum.FOO)
+    model.save()
 
-        data = peewee_plus.EnumField(TestEnum)
+    model = BasicModel.get()
+    assert model.data == BasicEnum.FOO
 
-    fakedb.create_tables([TestModel])
+    with pytest.raises(peewee.IntegrityError):
+        ModifiedModel.get()
 
-    model = TestModel(data=TestEnum.FOO)
-    model.save()
+    with pytest.raises(TypeError):
+        bad = BasicModel(data=BadEnum.NOTHING)
+        bad.save()
 
-    model = TestModel.get()
-    assert model.data == TestEnum.FOO
 
-    class ModifiedEnum(enum.Enum):
-        BAR = "buzz"
+def test_bytes(fakedb):
+    """Test that names returned from the database as bytes are decoded"""
 
-    class ModifiedModel(peewee.Model):
-        class Meta:
-            table_name = TestModel._meta.table_name  # pylint: disable=protected-access
-            database = fakedb
+    create_tables(fakedb, BasicModel)
 
-        data = peewee_plus.EnumField(ModifiedEnum)
+    BasicModel(data=BasicEnum.BAR).save()
 
-    with pytest.raises(peewee.IntegrityError):
-        ModifiedModel.get()
+    # SQLite returns blobs as bytes, like some other backends do for binary collations
+    table = BasicModel._meta.table_name  # pylint: disable=protected-access
+    fakedb.execute_sql(f'UPDATE "{table}" SET data = CAST(data AS BLOB)')
+    assert isinstance(
+        fakedb.execute_sql(f'SELECT data FROM "{table}"').fetchone()[0], bytes
+    )
 
-    class BadEnum(enum.Enum):
-        NOTHING = "nowhere"
+    assert BasicModel.get().data == BasicEnum.BAR
 
-    with pytest.raises(TypeError):
-        bad = TestModel(data=BadEnum.NOTHING)
-        bad.save()
+
+def test_flag(fakedb):
+    """Test that multi-bit flag members can be stored"""
+
+    create_tables(fakedb, FlagModel)
+
+    FlagModel(data=FlagEnum.READ_WRITE).save()
+    FlagModel(data=FlagEnum.READ | FlagEnum.WRITE).save()
+
+    assert [model.data for model in FlagModel.select()] == [FlagEnum.READ_WRITE] * 2
@@ -0,0 +1,38 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-import
+import peewee
+
+import peewee_plus
+from .fixtures import fakedb
+from .fixtures import fakedb_engine
+
+
+def test_public_api():
+    """Test that the public API components are exposed via ``__all__``"""
+
+    assert peewee_plus.flat_transaction.__name__ in peewee_plus.__all__
+
+
+def test_nesting(fakedb):
+    """Test that nested calls reuse the open transaction"""
+
+    proxy = peewee.DatabaseProxy()
+    depths = []
+
+    @peewee_plus.flat_transaction(proxy)
+    def subquery():
+        depths.append(fakedb.transaction_depth())
+
+    @peewee_plus.flat_transaction(proxy)
+    def query():
+        depths.append(fakedb.transaction_depth())
+        subquery()
+
+    # The proxy is only initialized after the functions are decorated to ensure that the
+    # database is not accessed at decoration time
+    proxy.initialize(fakedb)
+
+    query()
+    subquery()
+    assert depths == [1, 1, 1]
+    assert not fakedb.in_transaction()
@@ -2,13 +2,82 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=too-few-public-methods
 # pylint: disable=unused-import
+import datetime
+import json
+import math
 from pathlib import Path
 
 import peewee
 import pytest
 
 import peewee_plus
+from .fixtures import atomic_db
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class JSONModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    some_data = peewee_plus.JSONField()
+
+
+class SortedModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+        # Needs to match the table name below
+        table_name = "params_table"
+
+    some_data = peewee_plus.JSONField(dump_params={"sort_keys": True, "indent": 2})
+
+
+class SortedTextModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+        # Needs to match the table name above
+        table_name = "params_table"
+
+    some_data = peewee.TextField()
+
+
+class NullModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+        # Needs to match the table name in the query in ``test_null``
+        table_name = "null_table"
+
+    some_data = peewee_plus.JSONField(null=True)
+
+
+class RawModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    encoded = peewee_plus.JSONField()
+    raw = peewee_plus.JSONField(raw=True)
+
+
+class GoodModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+        # Needs to match the table name below
+        table_name = "one_table"
+
+    id = peewee.AutoField()
+    some_data = peewee_plus.JSONField()
+
+
+class BadModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+        # Needs to match the table name above
+        table_name = "one_table"
+
+    id = peewee.AutoField()
+    some_data = peewee.TextField()
 
 
 def test_public_api():
@@ -17,48 +86,130 @@ def test_public_api():
     assert peewee_plus.JSONField.__name__ in peewee_plus.__all__
 
 
-def test_json(fakedb):
+def test_json(atomic_db):
     """Test basic usage of JSONField class"""
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        some_data = peewee_plus.JSONField()
-
-    fakedb.create_tables([TestModel])
+    create_tables(atomic_db, JSONModel)
 
     data = {"foo": 10, "bar": ["hello", "world"], "baz": True}
 
-    model = TestModel(some_data=data)
+    model = JSONModel(some_data=data)
     model.save()
 
-    model = TestModel.get()
+    model = JSONModel.get()
     assert model.some_data == data
 
 
-def test_errors(fakedb):
-    """Test that errors are raised as expected"""
+def test_params(fakedb):
+    """Test that encoding parameters are respected"""
+
+    create_tables(fakedb, SortedModel)
 
-    class GoodModel(peewee.Model):
-        class Meta:
-            database = fakedb
-            # Needs to match the table name below
-            table_name = "one_table"
+    data = {"foo": 2**64 + 1, "bar": ["hello", "world"], "baz": {"fizz": None}}
+
+    model = SortedModel(some_data=data)
+    model.save()
 
-        id = peewee.AutoField()
-        some_data = peewee_plus.JSONField()
+    assert SortedModel.get().some_data == data
+    assert isinstance(SortedModel.get().some_data["foo"], int)
+    assert SortedTextModel.get().some_data == json.dumps(data, sort_keys=True, indent=2)
 
-    class BadModel(peewee.Model):
-        class Meta:
-            database = fakedb
-            # Needs to match the table name above
-            table_name = "one_table"
 
-        id = peewee.AutoField()
-        some_data = peewee.TextField()
+def test_null(fakedb):
+    """Test that null values can be read back"""
+
+    create_tables(fakedb, NullModel)
+
+    model = NullModel(some_data={"foo": 1})
+    model.save()
 
-    fakedb.create_tables([GoodModel])
+    # The field encodes ``None`` as a JSON null, so SQL NULL has to be written directly
+    fakedb.execute_sql("UPDATE null_table SET some_data = NULL")
+
+    model = NullModel.get()
+    assert model.some_data is None
+
+
+def test_raw(atomic_db):
+    """Test that pre-encoded values are only passed through when requested"""
+
+    create_tables(atomic_db, RawModel)
+
+    data = {"foo": 10, "bar": ["hello", "world"]}
+
+    RawModel(encoded=json.dumps(data), raw=json.dumps(data)).save()
+    RawModel(encoded="", raw=json.dumps(data).encode("utf-8")).save()
+
+    first, second = list(RawModel.select().order_by(RawModel.id))
+    assert first.encoded == json.dumps(data)
+    assert first.raw == data
+    assert second.encoded == ""
+    assert second.raw == data
+
+
+def test_backends():
+    """Test that orjson and the standard library encode and decode values the same way"""
+
+    pytest.importorskip("orjson")
+
+    # pylint: disable=protected-access
+    fast_dumps = peewee_plus._make_json_encoder({}, fast=True)
+    fast_loads = peewee_plus._make_json_decoder({}, fast=True)
+    slow_dumps = peewee_plus._make_json_encoder({})
+    slow_loads = peewee_plus._make_json_decoder({})
+
+    for value in (
+        {"foo": 10, "bar": ["hello", "world"], "baz": True, 1: None},
+        [1.5, "\u2603", {"nested": {"deeper": []}}],
+        "just a string",
+    ):
+        assert fast_loads(fast_dumps(value)) == slow_loads(slow_dumps(value))
+        assert fast_loads(slow_dumps(value)) == slow_loads(fast_dumps(value))
+
+    for dumps in (fast_dumps, slow_dumps):
+        with pytest.raises(TypeError):
+            dumps(Path("."))
+
+    # The differences below are documented on ``JSONField``; the standard library must keep
+    # values intact, while orjson is only expected to behave as documented
+    big = 2**64 + 1
+    assert fast_dumps(big) == slow_dumps(big)
+    assert slow_loads(slow_dumps(big)) == big
+    assert isinstance(slow_loads(slow_dumps(big)), int)
+    assert isinstance(fast_loads(fast_dumps(big)), float)
+
+    assert slow_dumps(float("nan")) == "NaN"
+    assert math.isnan(slow_loads(slow_dumps(float("nan"))))
+    assert fast_loads(fast_dumps(float("nan"))) is None
+
+    moment = datetime.datetime(2020, 5, 22, 12, 30)
+    with pytest.raises(TypeError):
+        slow_dumps(moment)
+    assert fast_loads(fast_dumps(moment)) == moment.isoformat()
+
+    for loads in (fast_loads, slow_loads):
+        with pytest.raises(json.JSONDecodeError):
+            loads("This{ string' is not, valid JSON;")
+
+
+def test_fast(monkeypatch):
+    """Test that orjson is only used when it is requested"""
+
+    # pylint: disable=protected-access
+    assert peewee_plus.JSONField()._dumps({"foo": 1}) == '{"foo": 1}'
+
+    if peewee_plus.orjson is not None:
+        assert peewee_plus.JSONField(fast=True)._dumps({"foo": 1}) == '{"foo":1}'
+
+    monkeypatch.setattr(peewee_plus, "orjson", None)
+    with pytest.raises(ImportError):
+        peewee_plus.JSONField(fast=True)
+
+
+def test_errors(fakedb):
+    """Test that errors are raised as expected"""
+
+    create_tables(fakedb, GoodModel)
 
     with pytest.raises(ValueError):
         # The usage of path here is arbitrary, it just needs to be any
@@ -66,6 +217,10 @@ def test_errors(fakedb):
         bad = GoodModel(some_data=Path("."))
         bad.save()
 
+    with pytest.raises(ValueError):
+        bad = GoodModel(some_data=datetime.datetime.now())
+        bad.save()
+
     good = GoodModel(some_data={"foo": 123})
     good.save()
 
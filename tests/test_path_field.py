@@ -7,7 +7,30 @@ from pathlib import Path
 import peewee
 
 import peewee_plus
+from .fixtures import atomic_db
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+BASE_PATH = Path("/etc", "foobar")
+
+
+class PathModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    name = peewee.CharField()
+    some_path = peewee_plus.PathField()
+
+
+class RelativePathModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    name = peewee.CharField()
+    some_path = peewee_plus.PathField(relative_to=BASE_PATH)
 
 
 def test_public_api():
@@ -16,61 +39,45 @@ def test_public_api():
     assert peewee_plus.PathField.__name__ in peewee_plus.__all__
 
 
-def test_conversion(fakedb):
+def test_conversion(atomic_db):
     """Test basic usage of PathField for roundtrip compatibility"""
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        name = peewee.CharField()
-        some_path = peewee_plus.PathField()
-
-    fakedb.create_tables([TestModel])
+    create_tables(atomic_db, PathModel)
 
     path1 = Path("foo", "bar", "baz")
-    model1 = TestModel(name="one", some_path=path1)
+    model1 = PathModel(name="one", some_path=path1)
     model1.save()
 
-    model1 = TestModel.get(TestModel.name == "one")
+    model1 = PathModel.get(PathModel.name == "one")
     assert model1.some_path == path1
     assert not model1.some_path.is_absolute()
 
     path2 = Path("/etc", "fizz", "buzz")
-    model2 = TestModel(name="two", some_path=path2)
+    model2 = PathModel(name="two", some_path=path2)
     model2.save()
 
-    model2 = TestModel.get(TestModel.name == "two")
+    model2 = PathModel.get(PathModel.name == "two")
     assert model2.some_path == path2
     assert model2.some_path.is_absolute()
 
 
-def test_relative_to(fakedb):
+def test_relative_to(atomic_db):
     """Test usage of the ``relative_to`` parameter"""
 
-    base_path = Path("/etc", "foobar")
-
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        name = peewee.CharField()
-        some_path = peewee_plus.PathField(relative_to=base_path)
-
-    fakedb.create_tables([TestModel])
+    create_tables(atomic_db, RelativePathModel)
 
     path1 = Path("foo", "bar", "baz")
-    model1 = TestModel(name="one", some_path=path1)
+    model1 = RelativePathModel(name="one", some_path=path1)
     model1.save()
 
-    model1 = TestModel.get(TestModel.name == "one")
+    model1 = RelativePathModel.get(RelativePathModel.name == "one")
     assert model1.some_path.is_absolute()
-    assert model1.some_path == base_path / path1
+    assert model1.some_path == BASE_PATH / path1
 
     path2 = Path("fizz", "buzz")
-    model2 = TestModel(name="two", some_path=base_path / path2)
+    model2 = RelativePathModel(name="two", some_path=BASE_PATH / path2)
     model2.save()
 
-    model2 = TestModel.get(TestModel.name == "two")
+    model2 = RelativePathModel.get(RelativePathModel.name == "two")
     assert model2.some_path.is_absolute()
-    assert model2.some_path == base_path / path2
+    assert model2.some_path == BASE_PATH / path2
@@ -5,7 +5,18 @@
 import peewee
 
 import peewee_plus
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class FloatModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    precise = peewee_plus.PrecisionFloatField(max_digits=7, decimal_places=3)
+    imprecise = peewee.FloatField()
 
 
 def test_public_api():
@@ -21,17 +32,10 @@ def test_public_api():
 def test_compatibility(fakedb):
     """Check that the precision float field works on sqlite"""
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        precise = peewee_plus.PrecisionFloatField(max_digits=7, decimal_places=3)
-        imprecise = peewee.FloatField()
-
-    fakedb.create_tables([TestModel])
+    create_tables(fakedb, FloatModel)
 
-    model = TestModel(precise=1234.567, imprecise=1234.567)
+    model = FloatModel(precise=1234.567, imprecise=1234.567)
     model.save()
 
-    model = TestModel.get()
+    model = FloatModel.get()
     assert model.precise == model.imprecise
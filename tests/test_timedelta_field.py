@@ -8,7 +8,19 @@ from pathlib import Path
 import peewee
 
 import peewee_plus
+from .fixtures import atomic_db
+from .fixtures import create_tables
 from .fixtures import fakedb
+from .fixtures import fakedb_engine
+from .fixtures import fakedb_proxy
+
+
+class TimedeltaModel(peewee.Model):
+    class Meta:
+        database = fakedb_proxy
+
+    name = peewee.CharField()
+    some_timedelta = peewee_plus.TimedeltaField()
 
 
 def test_public_api():
@@ -17,21 +29,14 @@ def test_public_api():
     assert peewee_plus.TimedeltaField.__name__ in peewee_plus.__all__
 
 
-def test_conversion(fakedb):
+def test_conversion(atomic_db):
     """Test basic usage of PathField for roundtrip compatibility"""
 
-    class TestModel(peewee.Model):
-        class Meta:
-            database = fakedb
-
-        name = peewee.CharField()
-        some_timedelta = peewee_plus.TimedeltaField()
-
-    fakedb.create_tables([TestModel])
+    create_tables(atomic_db, TimedeltaModel)
 
     delta = datetime.timedelta(seconds=300)
-    model = TestModel(name="one", some_timedelta=delta)
+    model = TimedeltaModel(name="one", some_timedelta=delta)
     model.save()
 
-    new = TestModel.get(TestModel.name == "one")
+    new = TimedeltaModel.get(TimedeltaModel.name == "one")
     assert new.some_timedelta == delta